@@ -0,0 +1,87 @@
+# scripts/03_evaluate.py
+
+import os
+import sys
+import json
+import argparse
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.evaluation.query_generator import generate_queries, QUERY_STYLES
+from src.evaluation.harness import build_config_grid, run_grid, write_report
+
+def _on_off(value: str) -> bool:
+    if value not in ("on", "off"):
+        raise argparse.ArgumentTypeError("expected 'on' or 'off'")
+    return value == "on"
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate search quality and latency across pipeline configurations.")
+    parser.add_argument("--data", default="data/laptop_data_cleaned.csv", help="Dataset used to generate labeled queries.")
+    parser.add_argument("--out-dir", default="artifacts/eval", help="Directory for the JSON/CSV reports.")
+    parser.add_argument("--k", type=int, default=5, help="Cutoff for recall@k and nDCG@k (the rerank depth).")
+    parser.add_argument("--retrieve", type=int, nargs="+", default=[10, 20, 50, 100], help="Retrieve depths to sweep.")
+    parser.add_argument("--expand", type=_on_off, nargs="+", default=[True, False], help="Query expansion settings (on/off).")
+    parser.add_argument("--rerank", type=_on_off, nargs="+", default=[True, False], help="Reranking settings (on/off).")
+    parser.add_argument("--filter", type=_on_off, nargs="+", default=[True, False], help="Hard spec filter settings (on/off).")
+    parser.add_argument("--backends", nargs="+", default=["pinecone"], choices=["pinecone", "memory"], help="Vector backends to compare.")
+    parser.add_argument("--styles", nargs="+", default=list(QUERY_STYLES), choices=list(QUERY_STYLES), help="Query phrasing styles to generate.")
+    parser.add_argument("--queries-per-combo", type=int, default=10, help="Queries sampled per attribute combination.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for query sampling.")
+    parser.add_argument("--min-capped-recall", type=float, default=0.0, help="Quality bar for the recommended configuration.")
+    parser.add_argument("--min-ndcg", type=float, default=0.0, help="Quality bar for the recommended configuration.")
+    parser.add_argument("--frontier-style", choices=list(QUERY_STYLES), default=None, help="Compute the Pareto frontier and quality bar on one query style only (default: all queries).")
+    args = parser.parse_args()
+    if args.k < 1:
+        parser.error("--k must be at least 1")
+    if min(args.retrieve) < args.k:
+        parser.error(f"--retrieve depths must be at least --k ({args.k})")
+    if args.queries_per_combo < 1:
+        parser.error("--queries-per-combo must be at least 1")
+    if args.frontier_style and args.frontier_style not in args.styles:
+        parser.error(f"--frontier-style {args.frontier_style} is not among --styles")
+
+    # --- Labeled Queries (same id scheme as 01_build_index.py) ---
+    df = pd.read_csv(args.data)
+    df.fillna(0, inplace=True)
+    df.insert(0, 'id', range(len(df)))
+    df['id'] = df['id'].astype(str)
+
+    queries = generate_queries(
+        df, styles=tuple(args.styles), queries_per_combo=args.queries_per_combo,
+        min_relevant=args.k, seed=args.seed,
+    )
+    if not queries:
+        parser.error("no labeled queries were generated; try a smaller --k or other --styles")
+    os.makedirs(args.out_dir, exist_ok=True)
+    with open(os.path.join(args.out_dir, "queries.json"), 'w') as f:
+        json.dump(queries, f, indent=2)
+    num_determined = sum(1 for q in queries if q["filter_determined"])
+    print(f"📝 Generated {len(queries)} labeled queries ({num_determined} fully determined by the spec filter).")
+
+    # --- Grid Evaluation ---
+    configs = build_config_grid(
+        retrieve_depths=args.retrieve,
+        expand_options=args.expand,
+        rerank_options=args.rerank,
+        backends=args.backends,
+        filter_options=args.filter,
+    )
+    results = run_grid(queries, configs, k=args.k)
+    report, paths = write_report(
+        results, args.out_dir, min_capped_recall=args.min_capped_recall, min_ndcg=args.min_ndcg,
+        style=args.frontier_style,
+    )
+
+    scope = f"{args.frontier_style} queries" if args.frontier_style else "all queries"
+    print(f"\n✅ Pareto frontier on {scope} (fastest first):")
+    for name in report["pareto_frontier"]:
+        print(f"  - {name}")
+    if report["recommended"]:
+        print(f"\n🏁 Cheapest configuration meeting the quality bar: {report['recommended']}")
+    else:
+        print("\n❌ No configuration meets the quality bar.")
+    print(f"Reports written to {paths['json']} and {paths['csv']}")
+
+if __name__ == "__main__":
+    main()
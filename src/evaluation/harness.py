@@ -0,0 +1,220 @@
+# src/evaluation/harness.py
+
+import os
+import json
+import time
+import itertools
+import pandas as pd
+from typing import List, Dict, Optional, Callable, Iterable, Tuple
+
+from src.evaluation.metrics import recall_at_k, capped_recall_at_k, ndcg_at_k, percentile
+
+def build_config_grid(
+    retrieve_depths: Iterable[int] = (10, 20, 50, 100),
+    expand_options: Iterable[bool] = (True, False),
+    rerank_options: Iterable[bool] = (True, False),
+    backends: Iterable[str] = ("pinecone",),
+    filter_options: Iterable[bool] = (True, False),
+) -> List[Dict]:
+    """Returns the cartesian product of pipeline settings to evaluate."""
+    return [
+        {"backend": backend, "top_k_retrieve": depth, "expand": expand, "rerank": rerank, "filter_specs": filter_specs}
+        for backend, depth, expand, rerank, filter_specs in itertools.product(
+            backends, retrieve_depths, expand_options, rerank_options, filter_options
+        )
+    ]
+
+def _config_name(config: Dict) -> str:
+    return (
+        f"{config['backend']}|retrieve={config['top_k_retrieve']}"
+        f"|expand={'on' if config['expand'] else 'off'}"
+        f"|rerank={'on' if config['rerank'] else 'off'}"
+        f"|filter={'on' if config['filter_specs'] else 'off'}"
+    )
+
+# Metrics aggregated over all queries and again per query style
+QUALITY_METRICS = ("recall_at_k", "capped_recall_at_k", "ndcg_at_k")
+
+def _key(metric: str, style: Optional[str] = None) -> str:
+    """Result column for a metric, e.g. 'ndcg_at_k' or 'ndcg_at_k_paraphrase'."""
+    return f"{metric}_{style}" if style else metric
+
+def _aggregate(rows: List[Dict], style: Optional[str] = None) -> Dict:
+    n = len(rows)
+    latencies_ms = [row["latency_ms"] for row in rows]
+    summary = {_key("num_queries", style): n}
+    for metric in QUALITY_METRICS:
+        summary[_key(metric, style)] = sum(row[metric] for row in rows) / n if n else 0.0
+    summary[_key("latency_p95_ms", style)] = percentile(latencies_ms, 95)
+    return summary
+
+def evaluate_config(pipeline, queries: List[Dict], config: Dict, k: int = 5) -> Dict:
+    """
+    Runs every query through the pipeline under one configuration and
+    aggregates recall@k, capped recall@k, nDCG@k and per-query latency,
+    over all queries and per query style (suffixed columns such as
+    `ndcg_at_k_paraphrase`). Per-query rows are returned under `per_query`;
+    a query counts as filter-determined when the spec filter is on and the
+    filter alone selects exactly its relevant set.
+    """
+    search_kwargs = {
+        "top_k_retrieve": config["top_k_retrieve"],
+        "top_k_rerank": k,
+        "expand": config["expand"],
+        "rerank": config["rerank"],
+        "filter_specs": config["filter_specs"],
+        "verbose": False,
+    }
+    # Warm-up call so model and connection start-up costs are not timed
+    if queries:
+        pipeline.search(queries[0]["query"], **search_kwargs)
+
+    latencies_ms, per_query = [], []
+    for q in queries:
+        start = time.perf_counter()
+        results = pipeline.search(q["query"], **search_kwargs)
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+
+        retrieved_ids = [str(doc["id"]) for doc in results]
+        relevant_ids = set(q["relevant_ids"])
+        per_query.append({
+            "name": _config_name(config),
+            "query_id": q["query_id"],
+            "style": q.get("style", ""),
+            "filter_determined": config["filter_specs"] and q.get("filter_determined", False),
+            "num_results": len(retrieved_ids),
+            "num_relevant": len(relevant_ids),
+            "recall_at_k": recall_at_k(retrieved_ids, relevant_ids, k),
+            "capped_recall_at_k": capped_recall_at_k(retrieved_ids, relevant_ids, k),
+            "ndcg_at_k": ndcg_at_k(retrieved_ids, relevant_ids, k),
+            "latency_ms": latencies_ms[-1],
+        })
+
+    n = len(queries)
+    result = {
+        "name": _config_name(config),
+        **config,
+        "k": k,
+        "num_filter_determined": sum(1 for row in per_query if row["filter_determined"]),
+        "latency_mean_ms": sum(latencies_ms) / n if n else 0.0,
+        "latency_p50_ms": percentile(latencies_ms, 50),
+        **_aggregate(per_query),
+    }
+    for style in sorted({row["style"] for row in per_query if row["style"]}):
+        result.update(_aggregate([row for row in per_query if row["style"] == style], style))
+    result["per_query"] = per_query
+    return result
+
+def _dominates(a: Dict, b: Dict, style: Optional[str] = None) -> bool:
+    recall, ndcg, p95 = _key("capped_recall_at_k", style), _key("ndcg_at_k", style), _key("latency_p95_ms", style)
+    no_worse = a[recall] >= b[recall] and a[ndcg] >= b[ndcg] and a[p95] <= b[p95]
+    better = a[recall] > b[recall] or a[ndcg] > b[ndcg] or a[p95] < b[p95]
+    return no_worse and better
+
+def pareto_frontier(results: List[Dict], style: Optional[str] = None) -> List[Dict]:
+    """
+    Returns the results no other configuration dominates, i.e. none is at
+    least as good on capped recall, nDCG and p95 latency and strictly better
+    on one. With `style`, only that query style's metrics are compared.
+    The frontier is sorted by p95 latency; inputs are not modified.
+    """
+    frontier = [r for r in results if not any(_dominates(other, r, style) for other in results if other is not r)]
+    return sorted(frontier, key=lambda r: r[_key("latency_p95_ms", style)])
+
+def cheapest_config(
+    results: List[Dict],
+    min_capped_recall: float = 0.0,
+    min_ndcg: float = 0.0,
+    style: Optional[str] = None,
+) -> Optional[Dict]:
+    """
+    Returns the lowest-p95 configuration that meets the quality bar, if any.
+    With `style`, the bar and latency apply to that query style only.
+    """
+    passing = [
+        r for r in results
+        if r[_key("capped_recall_at_k", style)] >= min_capped_recall and r[_key("ndcg_at_k", style)] >= min_ndcg
+    ]
+    return min(passing, key=lambda r: r[_key("latency_p95_ms", style)]) if passing else None
+
+def run_grid(
+    queries: List[Dict],
+    configs: List[Dict],
+    k: int = 5,
+    pipeline_factory: Optional[Callable[[str], object]] = None,
+) -> List[Dict]:
+    """
+    Evaluates every configuration, creating one pipeline per backend so
+    models and indexes are loaded only once per backend.
+    """
+    if not queries:
+        raise ValueError("No queries to evaluate.")
+    if pipeline_factory is None:
+        # Imported lazily so metrics and reporting work without the model stack
+        from src.pipeline.semantic_pipeline import SemanticPipeline
+        def pipeline_factory(backend: str):
+            return SemanticPipeline(df=None, backend=backend)
+
+    results = []
+    pipelines = {}
+    for config in configs:
+        backend = config["backend"]
+        if backend not in pipelines:
+            pipelines[backend] = pipeline_factory(backend)
+        print(f"📏 Evaluating {_config_name(config)} on {len(queries)} queries...")
+        result = evaluate_config(pipelines[backend], queries, config, k=k)
+        print(
+            f"   recall@{k}={result['recall_at_k']:.3f} capped-recall@{k}={result['capped_recall_at_k']:.3f} nDCG@{k}={result['ndcg_at_k']:.3f} "
+            f"p95={result['latency_p95_ms']:.1f}ms filter-determined={result['num_filter_determined']}/{len(queries)}"
+        )
+        for style in sorted({q.get("style") for q in queries if q.get("style")}):
+            print(
+                f"   [{style}] capped-recall@{k}={result[_key('capped_recall_at_k', style)]:.3f} "
+                f"nDCG@{k}={result[_key('ndcg_at_k', style)]:.3f} p95={result[_key('latency_p95_ms', style)]:.1f}ms"
+            )
+        results.append(result)
+    return results
+
+def write_report(
+    results: List[Dict],
+    out_dir: str,
+    min_capped_recall: float = 0.0,
+    min_ndcg: float = 0.0,
+    style: Optional[str] = None,
+) -> Tuple[Dict, Dict[str, str]]:
+    """
+    Writes the full results and Pareto frontier as JSON and CSV. The
+    frontier and recommendation use all queries, or only `style` if given.
+    Returns the report dict and the paths written; `results` is not modified.
+    """
+    if style and results and _key("ndcg_at_k", style) not in results[0]:
+        raise ValueError(f"No '{style}' queries were evaluated.")
+    os.makedirs(out_dir, exist_ok=True)
+    per_query = [row for r in results for row in r.get("per_query", [])]
+    on_frontier = {id(r) for r in pareto_frontier(results, style)}
+    rows = [
+        {**{key: val for key, val in r.items() if key != "per_query"}, "pareto": id(r) in on_frontier}
+        for r in results
+    ]
+    rows.sort(key=lambda r: r[_key("latency_p95_ms", style)])
+    frontier = [r for r in rows if r["pareto"]]
+    recommended = cheapest_config(rows, min_capped_recall=min_capped_recall, min_ndcg=min_ndcg, style=style)
+
+    report = {
+        "quality_bar": {"min_capped_recall_at_k": min_capped_recall, "min_ndcg_at_k": min_ndcg, "style": style},
+        "recommended": recommended["name"] if recommended else None,
+        "pareto_frontier": [r["name"] for r in frontier],
+        "results": rows,
+    }
+    paths = {
+        "json": os.path.join(out_dir, "eval_report.json"),
+        "csv": os.path.join(out_dir, "eval_results.csv"),
+        "pareto_csv": os.path.join(out_dir, "pareto_frontier.csv"),
+        "per_query_csv": os.path.join(out_dir, "per_query_results.csv"),
+    }
+    with open(paths["json"], 'w') as f:
+        json.dump(report, f, indent=2)
+    pd.DataFrame(report["results"]).to_csv(paths["csv"], index=False)
+    pd.DataFrame(frontier).to_csv(paths["pareto_csv"], index=False)
+    pd.DataFrame(per_query).to_csv(paths["per_query_csv"], index=False)
+    return report, paths
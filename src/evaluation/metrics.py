@@ -0,0 +1,46 @@
+# src/evaluation/metrics.py
+
+import math
+import numpy as np
+from typing import List, Set
+
+def _check_k(k: int):
+    if k < 1:
+        raise ValueError(f"k must be at least 1, got {k}")
+
+def recall_at_k(retrieved_ids: List[str], relevant_ids: Set[str], k: int) -> float:
+    """Fraction of all relevant items found in the top-k."""
+    _check_k(k)
+    if not relevant_ids:
+        return 0.0
+    hits = sum(1 for doc_id in retrieved_ids[:k] if doc_id in relevant_ids)
+    return hits / len(relevant_ids)
+
+def capped_recall_at_k(retrieved_ids: List[str], relevant_ids: Set[str], k: int) -> float:
+    """
+    Fraction of the attainable relevant items found in the top-k.
+    The denominator is capped at k, since a spec query often has more
+    relevant laptops than result slots; when it has at least k, this
+    equals precision@k.
+    """
+    _check_k(k)
+    if not relevant_ids:
+        return 0.0
+    hits = sum(1 for doc_id in retrieved_ids[:k] if doc_id in relevant_ids)
+    return hits / min(len(relevant_ids), k)
+
+def ndcg_at_k(retrieved_ids: List[str], relevant_ids: Set[str], k: int) -> float:
+    """Binary-gain nDCG@k."""
+    _check_k(k)
+    if not relevant_ids:
+        return 0.0
+    dcg = sum(
+        1.0 / math.log2(rank + 2)
+        for rank, doc_id in enumerate(retrieved_ids[:k])
+        if doc_id in relevant_ids
+    )
+    idcg = sum(1.0 / math.log2(rank + 2) for rank in range(min(len(relevant_ids), k)))
+    return dcg / idcg
+
+def percentile(values: List[float], q: float) -> float:
+    return float(np.percentile(values, q)) if values else 0.0
@@ -0,0 +1,138 @@
+# src/evaluation/query_generator.py
+
+import random
+import pandas as pd
+from typing import List, Dict, Optional, Tuple
+
+from src.preprocessing.query_parser import parse_query_for_specs, doc_matches_specs
+
+# --- Attribute Combinations ---
+# Each tuple is a set of columns that a generated query constrains at once.
+ATTRIBUTE_COMBOS: List[Tuple[str, ...]] = [
+    ('Company', 'TypeName'),
+    ('Company', 'Ram'),
+    ('TypeName', 'Ram'),
+    ('TypeName', 'Cpu_brand'),
+    ('Company', 'Cpu_brand'),
+    ('Company', 'TypeName', 'Ram'),
+    ('TypeName', 'Ram', 'Cpu_brand'),
+    ('Company', 'Ram', 'SSD'),
+    ('TypeName', 'Gpu_brand', 'Ram'),
+    ('Os', 'TypeName', 'Cpu_brand'),
+]
+
+# --- Query Styles ---
+# 'spec' phrasings are ones parse_query_for_specs extracts, so the hard filter
+# does most of the work. 'paraphrase' phrasings avoid the parser's keywords, so
+# retrieval and reranking have to find the relevant laptops on their own.
+QUERY_STYLES = ("spec", "paraphrase")
+
+PARAPHRASE_TYPE_NAMES = {
+    'Gaming': 'gamer',
+    'Ultrabook': 'thin and light',
+    '2 in 1 Convertible': 'convertible',
+}
+
+def _paraphrase(column: str, value) -> Optional[str]:
+    """Phrases an attribute value without the keywords the query parser matches."""
+    if column == 'Company':
+        return str(value)
+    if column == 'TypeName':
+        return PARAPHRASE_TYPE_NAMES.get(str(value))
+    if column == 'Ram':
+        return f"{int(value)} gigs of memory"
+    if column == 'SSD':
+        return f"{int(value)} gigs of solid state storage" if int(value) > 0 else None
+    if column == 'Gpu_brand':
+        return "GeForce graphics" if str(value) == 'Nvidia' else None
+    return None
+
+def _phrase(column: str, value) -> Optional[str]:
+    """
+    Turns an attribute value into natural query text.
+    Returns None for values that have no unambiguous phrasing
+    (e.g. 'Other Intel Processor' or an 'Others' OS).
+    """
+    if column == 'Company':
+        return str(value)
+    if column == 'TypeName':
+        return str(value).lower()
+    if column == 'Ram':
+        return f"{int(value)}GB RAM"
+    if column == 'SSD':
+        return f"{int(value)}GB SSD" if int(value) > 0 else None
+    if column == 'Cpu_brand':
+        value = str(value)
+        return f"{value.replace('Intel ', '')} processor" if value.startswith('Intel Core') else None
+    if column == 'Gpu_brand':
+        return "Nvidia graphics" if str(value) == 'Nvidia' else None
+    if column == 'Os':
+        return {'Windows': 'Windows', 'Mac': 'Mac'}.get(str(value))
+    return None
+
+def _build_query_text(phrases: Dict[str, str]) -> str:
+    """Assembles phrases as '<Company> <TypeName> laptop with <spec> and <spec>'."""
+    head = [phrases[col] for col in ('Company', 'TypeName') if col in phrases]
+    tail = [text for col, text in phrases.items() if col not in ('Company', 'TypeName')]
+    query = " ".join(head + ["laptop"])
+    if tail:
+        query += " with " + " and ".join(tail)
+    return query
+
+def generate_queries(
+    df: pd.DataFrame,
+    id_col: str = "id",
+    combos: List[Tuple[str, ...]] = ATTRIBUTE_COMBOS,
+    styles: Tuple[str, ...] = QUERY_STYLES,
+    queries_per_combo: int = 10,
+    min_relevant: int = 5,
+    seed: int = 42,
+) -> List[Dict]:
+    """
+    Generates labeled, spec-constrained queries from the laptop dataset.
+    Every row whose attributes equal the query's constraints is relevant,
+    so the labels are exact rather than judged. Groups with fewer than
+    `min_relevant` rows are skipped so capped recall@k is not dominated by
+    queries with one or two relevant laptops; pass the evaluation k.
+
+    Each query is flagged `filter_determined` when the specs the parser
+    extracts from it select exactly the relevant rows. For those queries
+    every result that survives the filter is relevant, so reranking and
+    result order cannot change the metrics. Expansion and retrieve depth
+    still matter, since they decide how many relevant laptops are among
+    the retrieved candidates.
+    """
+    unknown = set(styles) - set(QUERY_STYLES)
+    if unknown:
+        raise ValueError(f"Unknown query styles: {sorted(unknown)}. Expected {QUERY_STYLES}.")
+    phrasers = {"spec": _phrase, "paraphrase": _paraphrase}
+    rng = random.Random(seed)
+    records = df.to_dict('records')
+    queries = []
+
+    for style in styles:
+        phrase = phrasers[style]
+        for combo in combos:
+            candidates = []
+            for values, group in df.groupby(list(combo), sort=True):
+                values = values if isinstance(values, tuple) else (values,)
+                phrases = {col: phrase(col, val) for col, val in zip(combo, values)}
+                if any(text is None for text in phrases.values()) or len(group) < min_relevant:
+                    continue
+                candidates.append({
+                    "query": _build_query_text(phrases),
+                    "style": style,
+                    "constraints": {col: str(val) for col, val in zip(combo, values)},
+                    "relevant_ids": [str(i) for i in group[id_col]],
+                })
+            rng.shuffle(candidates)
+            queries.extend(candidates[:queries_per_combo])
+
+    for q in queries:
+        specs = parse_query_for_specs(q["query"])
+        filtered_ids = {str(doc[id_col]) for doc in records if doc_matches_specs(doc, specs)}
+        q["filter_determined"] = filtered_ids == set(q["relevant_ids"])
+
+    for i, q in enumerate(queries):
+        q["query_id"] = f"q{i:04d}"
+    return queries
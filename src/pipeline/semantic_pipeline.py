@@ -7,9 +7,10 @@ from typing import List, Dict
 # --- Local Module Imports ---
 from src.retrieval.embedder import Embedder
 from src.retrieval.vector_index import VectorIndex
+from src.retrieval.memory_index import InMemoryVectorIndex
 from src.retrieval.reranker import Reranker
 from src.preprocessing.wordnet_controlled import expand_terms
-from src.preprocessing.query_parser import parse_query_for_specs
+from src.preprocessing.query_parser import parse_query_for_specs, doc_matches_specs
 from src.config import (
     PINECONE_API_KEY,
     PINECONE_ENV,
@@ -21,7 +22,7 @@ from src.config import (
 )
 
 class SemanticPipeline:
-    def __init__(self, df: pd.DataFrame = None, id_col="id", text_col="text", index_dir="artifacts/index"):
+    def __init__(self, df: pd.DataFrame = None, id_col="id", text_col="text", index_dir="artifacts/index", backend="pinecone"):
         self.df = df
         self.id_col = id_col
         self.text_col = text_col
@@ -34,21 +35,39 @@ class SemanticPipeline:
         print("Initializing models and services...")
         self.embedder = Embedder(EMBEDDING_MODEL)
         self.reranker = Reranker(RERANKER_MODEL)
-        self.vector_index = VectorIndex(
-            index_name=PINECONE_INDEX_NAME,
-            dimension=VECTOR_DIMENSION,
-            metric=VECTOR_METRIC,
-            api_key=PINECONE_API_KEY,
-            environment=PINECONE_ENV
-        )
+        self.backend = backend
+        if backend == "pinecone":
+            self.vector_index = VectorIndex(
+                index_name=PINECONE_INDEX_NAME,
+                dimension=VECTOR_DIMENSION,
+                metric=VECTOR_METRIC,
+                api_key=PINECONE_API_KEY,
+                environment=PINECONE_ENV
+            )
+        elif backend == "memory":
+            self.vector_index = InMemoryVectorIndex(dimension=VECTOR_DIMENSION, metric=VECTOR_METRIC)
+        else:
+            raise ValueError(f"Unknown vector backend: {backend}. Expected 'pinecone' or 'memory'.")
         # Load doc store if it exists
         try:
             with open(self.doc_store_path, 'r') as f:
                 self.doc_store = json.load(f)
         except FileNotFoundError:
             self.doc_store = None
+
+        # The in-memory index does not persist, so rebuild it from the doc store
+        # in search mode; with a DataFrame, build_index() embeds it instead.
+        if backend == "memory" and self.df is None and self.doc_store:
+            self._load_memory_index()
         print("Initialization complete.")
 
+    def _load_memory_index(self):
+        ids = list(self.doc_store.keys())
+        texts = [self.doc_store[doc_id][self.text_col] for doc_id in ids]
+        embeddings = self.embedder.encode(texts, normalize=True)
+        metadatas = [{"text": text} for text in texts]
+        self.vector_index.upsert(ids=ids, vectors=embeddings, metadatas=metadatas)
+
     def _hash_df(self) -> str:
         return hashlib.md5(pd.util.hash_pandas_object(self.df).values).hexdigest()
 
@@ -74,14 +93,20 @@ class SemanticPipeline:
     def build_index(self, force: bool = False):
         if self.df is None:
             raise ValueError("DataFrame must be provided to build the index.")
-        if not force and self._is_index_fresh():
+        # The manifest and doc store on disk describe the persisted Pinecone index,
+        # so the in-memory backend always rebuilds and never writes them.
+        persisted = self.backend == "pinecone"
+        if persisted and not force and self._is_index_fresh():
             print("✅ Index is already up-to-date. Skipping build.")
             return
 
         print("🚀 Building new index...")
         self.doc_store = self.df.set_index(self.id_col).to_dict('index')
-        with open(self.doc_store_path, 'w') as f:
-            json.dump(self.doc_store, f)
+        if persisted:
+            with open(self.doc_store_path, 'w') as f:
+                json.dump(self.doc_store, f)
+        else:
+            self.vector_index = InMemoryVectorIndex(dimension=VECTOR_DIMENSION, metric=VECTOR_METRIC)
         
         texts = self.df[self.text_col].tolist()
         ids = self.df[self.id_col].tolist()
@@ -90,36 +115,56 @@ class SemanticPipeline:
         metadatas = [{"text": text} for text in texts]
         self.vector_index.upsert(ids=ids, vectors=embeddings, metadatas=metadatas)
 
-        self._write_manifest()
+        if persisted:
+            self._write_manifest()
         print("✅ Index build complete.")
 
     def _matches_specs(self, doc_id: str, specs: Dict) -> bool:
         doc = self.doc_store.get(doc_id)
         if not doc:
             return False
-        for key, value in specs.items():
-            if value and str(doc.get(key, 'N/A')).lower() != str(value).lower():
-                return False
-        return True
+        return doc_matches_specs(doc, specs)
 
-    def search(self, query: str, top_k_retrieve: int = 50, top_k_rerank: int = 5) -> List[Dict]:
+    def search(
+        self,
+        query: str,
+        top_k_retrieve: int = 50,
+        top_k_rerank: int = 5,
+        expand: bool = True,
+        rerank: bool = True,
+        filter_specs: bool = True,
+        verbose: bool = True,
+    ) -> List[Dict]:
+        """
+        Runs the retrieve -> filter -> rerank pipeline for a query.
+        `expand`, `filter_specs` and `rerank` toggle the WordNet expansion,
+        hard spec filter and cross-encoder stages; with reranking off,
+        candidates keep their vector score order.
+        """
         if not self.doc_store:
             raise RuntimeError("Document store not found. Please build the index first.")
         
         # --- Models are already initialized, so we use them directly ---
-        expanded_query = expand_terms(query)
+        expanded_query = expand_terms(query) if expand else query
         query_specs = parse_query_for_specs(query)
-        print(f"🔎 Expanded Query: {expanded_query}")
-        print(f"⚙️  Parsed Specs: {query_specs}")
+        if verbose:
+            print(f"🔎 Expanded Query: {expanded_query}")
+            print(f"⚙️  Parsed Specs: {query_specs}")
 
-        query_embedding = self.embedder.encode([expanded_query], normalize=True)[0]
+        query_embedding = self.embedder.encode([expanded_query], normalize=True, show_progress_bar=verbose)[0]
         retrieved_docs = self.vector_index.query(query_embedding, top_k=top_k_retrieve)
-        print(f"Retrieved {len(retrieved_docs)} semantic candidates.")
+        if verbose: print(f"Retrieved {len(retrieved_docs)} semantic candidates.")
+
+        if filter_specs:
+            filtered_candidates = [doc for doc in retrieved_docs if self._matches_specs(doc['id'], query_specs)]
+            if verbose: print(f"Filtered down to {len(filtered_candidates)} candidates matching exact specs.")
+        else:
+            filtered_candidates = retrieved_docs
 
-        filtered_candidates = [doc for doc in retrieved_docs if self._matches_specs(doc['id'], query_specs)]
-        print(f"Filtered down to {len(filtered_candidates)} candidates matching exact specs.")
+        if not rerank:
+            return filtered_candidates[:top_k_rerank]
 
         reranked_docs = self.reranker.rerank(query, filtered_candidates, top_k=top_k_rerank)
-        print(f"Reranked to top {len(reranked_docs)} results.")
+        if verbose: print(f"Reranked to top {len(reranked_docs)} results.")
         
         return reranked_docs
\ No newline at end of file
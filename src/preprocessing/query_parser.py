@@ -1,6 +1,16 @@
 import re
 from typing import Dict, Optional, Any
 
+def doc_matches_specs(doc: Dict[str, Any], specs: Dict[str, Optional[Any]]) -> bool:
+    """
+    Checks whether a document satisfies every non-empty parsed spec.
+    Values are compared as case-insensitive strings.
+    """
+    for key, value in specs.items():
+        if value and str(doc.get(key, 'N/A')).lower() != str(value).lower():
+            return False
+    return True
+
 def parse_query_for_specs(query: str) -> Dict[str, Optional[Any]]:
     """
     Parses a query string to extract structured laptop specifications.
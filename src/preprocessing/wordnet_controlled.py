@@ -24,6 +24,9 @@ except LookupError:
     nltk.download('wordnet')
 # --- Configuration ---
 
+# Common function words that never need expansion
+STOPWORDS = set(stopwords.words('english'))
+
 # Words that WordNet often misinterprets in a tech context
 DO_NOT_EXPAND = {'ram', 'core', 'thread', 'gb', 'windows', 'os'}
 
@@ -8,10 +8,10 @@ class Embedder:
     def __init__(self, model_name: str):
         self.model = SentenceTransformer(model_name)
 
-    def encode(self, texts: List[str], normalize: bool = True) -> np.ndarray:
+    def encode(self, texts: List[str], normalize: bool = True, show_progress_bar: bool = True) -> np.ndarray:
         return self.model.encode(
             texts, 
             normalize_embeddings=normalize,
-            show_progress_bar=True,
+            show_progress_bar=show_progress_bar,
             convert_to_numpy=True
         )
\ No newline at end of file
@@ -0,0 +1,59 @@
+# src/retrieval/memory_index.py
+
+from typing import List, Dict
+import numpy as np
+
+class InMemoryVectorIndex:
+    """
+    Exact brute-force vector index held in process memory.
+    Mirrors the VectorIndex interface so it can stand in for Pinecone
+    during offline evaluation or local development.
+    """
+    def __init__(self, dimension: int, metric: str = "cosine"):
+        if metric not in ("cosine", "dotproduct"):
+            raise ValueError(f"Unsupported metric for in-memory index: {metric}")
+        self.dimension = dimension
+        self.metric = metric
+        self.ids: List[str] = []
+        self.vectors = np.empty((0, dimension), dtype=np.float32)
+        self.metadatas: List[Dict] = []
+
+    def upsert(self, ids: List[str], vectors: np.ndarray, metadatas: List[Dict]):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.metric == "cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.clip(norms, 1e-12, None)
+
+        positions = {doc_id: pos for pos, doc_id in enumerate(self.ids)}
+        new_ids, new_vectors, new_metadatas = [], [], []
+        for i, v, m in zip(ids, vectors, metadatas):
+            doc_id = str(i)
+            if doc_id in positions:
+                self.vectors[positions[doc_id]] = v
+                self.metadatas[positions[doc_id]] = m
+            else:
+                positions[doc_id] = len(self.ids) + len(new_ids)
+                new_ids.append(doc_id)
+                new_vectors.append(v)
+                new_metadatas.append(m)
+
+        if new_ids:
+            self.ids.extend(new_ids)
+            self.vectors = np.vstack([self.vectors, np.stack(new_vectors)])
+            self.metadatas.extend(new_metadatas)
+
+    def query(self, vector: np.ndarray, top_k: int = 10) -> List[Dict]:
+        if not self.ids:
+            return []
+        vector = np.asarray(vector, dtype=np.float32)
+        if self.metric == "cosine":
+            vector = vector / max(float(np.linalg.norm(vector)), 1e-12)
+        scores = self.vectors @ vector
+
+        top_k = min(top_k, len(self.ids))
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            {"id": self.ids[i], "score": float(scores[i]), "text": self.metadatas[i].get("text", "")}
+            for i in top
+        ]
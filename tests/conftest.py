@@ -0,0 +1,5 @@
+import os
+import sys
+
+# This allows the tests to find the 'src' module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
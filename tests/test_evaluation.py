@@ -0,0 +1,126 @@
+import math
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.evaluation.metrics import recall_at_k, capped_recall_at_k, ndcg_at_k
+from src.evaluation.harness import pareto_frontier, cheapest_config, evaluate_config, run_grid
+from src.evaluation.query_generator import generate_queries
+from src.retrieval.memory_index import InMemoryVectorIndex
+
+def _result(name, capped_recall, ndcg, p95):
+    return {"name": name, "capped_recall_at_k": capped_recall, "ndcg_at_k": ndcg, "latency_p95_ms": p95}
+
+# --- Metrics ---
+
+def test_ndcg_known_rankings():
+    # Hits at ranks 1 and 3: (1 + 1/log2(4)) / (1 + 1/log2(3))
+    expected = 1.5 / (1 + 1 / math.log2(3))
+    assert ndcg_at_k(["a", "b", "c"], {"a", "c"}, 3) == pytest.approx(expected)
+    assert ndcg_at_k(["a", "c", "b"], {"a", "c"}, 3) == pytest.approx(1.0)
+    assert ndcg_at_k(["x", "y"], {"a"}, 2) == 0.0
+
+def test_ndcg_ideal_is_capped_at_k():
+    # Three relevant items but only two slots: ideal DCG is 1 + 1/log2(3)
+    expected = (1 / math.log2(3)) / (1 + 1 / math.log2(3))
+    assert ndcg_at_k(["x", "a"], {"a", "b", "c"}, 2) == pytest.approx(expected)
+
+def test_recall_and_capped_recall():
+    relevant = {"a", "b", "c", "d", "e", "f"}
+    retrieved = ["a", "x", "b"]
+    assert recall_at_k(retrieved, relevant, 3) == pytest.approx(2 / 6)
+    assert capped_recall_at_k(retrieved, relevant, 3) == pytest.approx(2 / 3)
+    assert capped_recall_at_k(["a", "b"], {"a", "b"}, 5) == 1.0
+
+@pytest.mark.parametrize("metric", [recall_at_k, capped_recall_at_k, ndcg_at_k])
+def test_metrics_reject_k_below_one(metric):
+    with pytest.raises(ValueError):
+        metric(["a"], {"a"}, 0)
+
+# --- Pareto frontier & quality bar ---
+
+def test_pareto_frontier_keeps_ties():
+    results = [_result("a", 0.8, 0.7, 10.0), _result("b", 0.8, 0.7, 10.0)]
+    assert [r["name"] for r in pareto_frontier(results)] == ["a", "b"]
+
+def test_pareto_frontier_drops_dominated_and_sorts_by_latency():
+    results = [
+        _result("slow_best", 0.9, 0.9, 50.0),
+        _result("fast_ok", 0.6, 0.5, 5.0),
+        _result("dominated", 0.6, 0.5, 20.0),
+        _result("equal_latency_worse", 0.9, 0.8, 50.0),
+    ]
+    frontier = pareto_frontier(results)
+    assert [r["name"] for r in frontier] == ["fast_ok", "slow_best"]
+    assert all("pareto" not in r for r in results)
+
+def test_frontier_and_bar_on_selected_style():
+    fast = {**_result("fast", 0.9, 0.9, 5.0), "capped_recall_at_k_paraphrase": 0.2, "ndcg_at_k_paraphrase": 0.2, "latency_p95_ms_paraphrase": 5.0}
+    slow = {**_result("slow", 0.9, 0.9, 9.0), "capped_recall_at_k_paraphrase": 0.6, "ndcg_at_k_paraphrase": 0.6, "latency_p95_ms_paraphrase": 9.0}
+    assert [r["name"] for r in pareto_frontier([fast, slow])] == ["fast"]
+    assert [r["name"] for r in pareto_frontier([fast, slow], style="paraphrase")] == ["fast", "slow"]
+    assert cheapest_config([fast, slow], min_ndcg=0.5)["name"] == "fast"
+    assert cheapest_config([fast, slow], min_ndcg=0.5, style="paraphrase")["name"] == "slow"
+
+def test_evaluate_config_reports_metrics_per_style():
+    class Pipeline:
+        def search(self, query, **kwargs):
+            return [{"id": "1"}, {"id": "2"}]
+
+    queries = [
+        {"query_id": "q0", "query": "a", "style": "spec", "relevant_ids": ["1", "2"], "filter_determined": True},
+        {"query_id": "q1", "query": "b", "style": "paraphrase", "relevant_ids": ["3", "4"], "filter_determined": False},
+    ]
+    config = {"backend": "memory", "top_k_retrieve": 10, "expand": False, "rerank": False, "filter_specs": True}
+    result = evaluate_config(Pipeline(), queries, config, k=2)
+
+    assert result["capped_recall_at_k"] == pytest.approx(0.5)
+    assert result["capped_recall_at_k_spec"] == 1.0
+    assert result["capped_recall_at_k_paraphrase"] == 0.0
+    assert result["num_queries_spec"] == result["num_queries_paraphrase"] == 1
+    assert result["num_filter_determined"] == 1
+
+def test_run_grid_rejects_empty_queries():
+    with pytest.raises(ValueError):
+        run_grid([], [{"backend": "memory"}], pipeline_factory=lambda backend: None)
+
+def test_cheapest_config():
+    results = [_result("fast", 0.5, 0.4, 5.0), _result("slow", 0.9, 0.9, 50.0), _result("mid", 0.8, 0.8, 20.0)]
+    assert cheapest_config(results, min_capped_recall=0.7)["name"] == "mid"
+    assert cheapest_config(results)["name"] == "fast"
+    assert cheapest_config(results, min_ndcg=0.95) is None
+
+# --- In-memory index ---
+
+def test_memory_index_upsert_overwrites_in_place():
+    index = InMemoryVectorIndex(dimension=2)
+    index.upsert(
+        ids=[0, 1, 2],
+        vectors=np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]),
+        metadatas=[{"text": "x"}, {"text": "y"}, {"text": "xy"}],
+    )
+    index.upsert(ids=[1], vectors=np.array([[3.0, 0.1]]), metadatas=[{"text": "new"}])
+
+    assert index.ids == ["0", "1", "2"]
+    results = index.query(np.array([1.0, 0.0]), top_k=3)
+    assert [r["id"] for r in results] == ["0", "1", "2"]
+    assert results[1]["text"] == "new"
+    assert results[0]["score"] == pytest.approx(1.0)
+    assert len(index.query(np.array([1.0, 0.0]), top_k=10)) == 3
+
+# --- Query generation ---
+
+def test_generate_queries_labels_and_filter_flag():
+    df = pd.DataFrame({
+        "id": [str(i) for i in range(6)],
+        "Company": ["Dell"] * 3 + ["Razer"] * 3,
+        "TypeName": ["Gaming"] * 6,
+    })
+    queries = generate_queries(df, combos=[("Company", "TypeName")], styles=("spec",), min_relevant=3)
+    by_text = {q["query"]: q for q in queries}
+
+    assert by_text["Dell gaming laptop"]["relevant_ids"] == ["0", "1", "2"]
+    assert by_text["Dell gaming laptop"]["filter_determined"]
+    # The parser does not know Razer, so the filter keeps every gaming laptop
+    assert not by_text["Razer gaming laptop"]["filter_determined"]
+    assert generate_queries(df, combos=[("Company", "TypeName")], styles=("spec",), min_relevant=4) == []